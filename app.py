@@ -2,14 +2,13 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from data_processing import (
-    load_data,
-    clean_data,
-    add_calculated_columns,
+    prepare_data,
     filter_data,
     calculate_overall_tendencies,
-    calculate_category_tendencies,
+    calculate_category_tendencies_multi,
     calculate_all_teams_tendencies,
     add_rankings,
+    rank_teams,
     format_percentage_with_rank,
     calculate_defensive_overall_tendencies,
     calculate_defensive_category_tendencies,
@@ -17,7 +16,11 @@ from data_processing import (
     yardline_bucket_to_range,
     ytg_bucket_to_range,
     df_to_html_table,
-    format_rank_with_color_class
+    scorecard_html,
+    scorecard_list_html,
+    format_rank_with_color_class,
+    format_pct,
+    FilterKey
 )
 
 # Page configuration
@@ -28,10 +31,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def load_css(file_name):
+@st.cache_data
+def read_css(file_name):
     with open(file_name) as f:
-        css_content = f.read()
-        st.markdown(f'<style>{css_content}</style>', unsafe_allow_html=True)
+        return f.read()
+
+def load_css(file_name):
+    st.markdown(f'<style>{read_css(file_name)}</style>', unsafe_allow_html=True)
 
 load_css('styles.css')
 
@@ -40,52 +46,33 @@ st.title("NFL Tendency Dashboard")
 st.markdown("---")
 
 # Load and process data
-@st.cache_data
+# cache_resource hands back the same frame on every rerun instead of a pickled
+# copy, which the identity-hashed caches below rely on; nothing downstream
+# mutates it (filters always return new frames)
+@st.cache_resource(show_spinner=False)
 def load_and_process_data():
     """Load and prepare data with caching"""
     import os
-    if os.path.exists('Data/PFF_2025_FULL_Play_Feed.csv'):
-        df = load_data('Data/PFF_2025_FULL_Play_Feed.csv')
-    else:
-        df = load_data()
-    df = clean_data(df)
-    df = add_calculated_columns(df)
-    return df
+    csv_path = 'Data/PFF_2025_FULL_Play_Feed.csv'
+    df = prepare_data(csv_path if os.path.exists(csv_path) else None)
+    # Row positions for each team, so team switches slice a partition
+    # instead of re-scanning the whole frame
+    off_team_idx = df.groupby('pff_OFFTEAM', observed=True).indices
+    def_team_idx = df.groupby('pff_DEFTEAM', observed=True).indices
+    return df, off_team_idx, def_team_idx
 
 # Load data
 try:
-    df = load_and_process_data()
+    df, off_team_idx, def_team_idx = load_and_process_data()
 except Exception as e:
     st.error(f"Error loading data: {e}")
     st.stop()
 
 # Get unique values for filters
-all_teams = sorted(df['pff_OFFTEAM'].dropna().unique())
-all_quarters = sorted(df['pff_QUARTER'].dropna().astype(int).unique())
-all_downs = sorted(df['pff_DOWN'].dropna().astype(int).unique())
-
-# Custom sort for weeks: 1-18, then WC, DP, CC, SB
-def sort_weeks(week_list):
-    numeric_weeks = []
-    playoff_weeks = []
-    playoff_order = ['WC', 'DP', 'CC', 'SB']
-    
-    for week in week_list:
-        if week.isdigit():
-            numeric_weeks.append(int(week))
-        else:
-            playoff_weeks.append(week)
-    
-    # Sort numeric weeks
-    numeric_weeks.sort()
-    
-    # Sort playoff weeks by defined order
-    playoff_weeks_sorted = [w for w in playoff_order if w in playoff_weeks]
-    
-    # Combine: numeric first, then playoffs
-    return [str(w) for w in numeric_weeks] + playoff_weeks_sorted
-
-all_weeks = sort_weeks(df['pff_WEEK'].dropna().astype(str).unique().tolist())
+all_teams = df['pff_OFFTEAM'].cat.categories.tolist()
+all_quarters = df['pff_QUARTER'].cat.categories.tolist()
+all_downs = df['pff_DOWN'].cat.categories.tolist()
+all_weeks = df['pff_WEEK'].cat.categories.tolist()
 min_time = int(df['minutes_remaining'].min())
 max_time = int(df['minutes_remaining'].max())
 min_ytg = int(df['pff_DISTANCE'].min())
@@ -213,24 +200,108 @@ if st.sidebar.button("Reset Situational Filters", use_container_width=True):
     st.session_state['reset_filters'] = True
     st.rerun()
     
-# Create filters dictionary
-filters = {
-    'team': selected_team,
-    'weeks': selected_weeks,
-    'quarters': selected_quarters,
-    'time_range': time_range,
-    'downs': selected_downs,
-    'yards_to_go_range': yards_to_go_range,
-    'yardline_range': yardline_range
-}
+# Freeze the situational filters (team excluded) into a hashable key so filtered
+# frames, tendencies and the all-teams ranking tables can be memoized on it
+filters_key = FilterKey(
+    weeks=tuple(selected_weeks),
+    quarters=tuple(selected_quarters),
+    time_range=tuple(time_range),
+    downs=tuple(selected_downs),
+    yards_to_go_range=tuple(yards_to_go_range),
+    yardline_range=tuple(yardline_range)
+)
 
-# Filter data for selected team
-df_filtered = filter_data(df, filters)
+# Every cache below takes the frame (and team index) explicitly but hashes it by
+# identity: both come from cache_resource, so they are stable across reruns and
+# a reload yields new objects and therefore new keys
+DATA_HASH_FUNCS = {pd.DataFrame: id, dict: id}
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=DATA_HASH_FUNCS)
+def cached_filter_data(data, team_idx, team, filters_key):
+    """Selected team's offensive plays for a set of situational filters"""
+    return filter_data(data, filters_key.to_filters(team), team_idx)
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=DATA_HASH_FUNCS)
+def cached_defensive_filter_data(data, team_idx, team, filters_key):
+    """Selected team's defensive plays for a set of situational filters"""
+    return filter_data(data, filters_key.to_filters(team), team_idx, team_column='pff_DEFTEAM')
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=DATA_HASH_FUNCS)
+def cached_overall_tendencies(data, team_idx, team, filters_key):
+    """Offensive scorecard metrics for the selected team"""
+    return calculate_overall_tendencies(cached_filter_data(data, team_idx, team, filters_key))
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=DATA_HASH_FUNCS)
+def cached_defensive_overall_tendencies(data, team_idx, team, filters_key):
+    """Defensive scorecard metrics for the selected team"""
+    return calculate_defensive_overall_tendencies(cached_defensive_filter_data(data, team_idx, team, filters_key))
+
+@st.cache_data(show_spinner=False, hash_funcs=DATA_HASH_FUNCS)
+def cached_all_teams_tendencies(data, filters_key, category_column=None):
+    """All teams' offensive tendencies for a set of situational filters"""
+    return calculate_all_teams_tendencies(data, filters_key.to_filters(), category_column)
+
+@st.cache_data(show_spinner=False, hash_funcs=DATA_HASH_FUNCS)
+def cached_all_teams_defensive_tendencies(data, filters_key):
+    """All teams' defensive tendencies for a set of situational filters"""
+    return calculate_all_teams_defensive_tendencies(data, filters_key.to_filters())
+
+def compute_rank_tables(filters_key):
+    """Rank of every team on each scorecard metric, offense and defense"""
+    return {
+        'offense': rank_teams(
+            cached_all_teams_tendencies(df, filters_key),
+            ['Motion_Pct', 'Run_Pct', 'PA_Pct', 'DB_Pct', 'Screen_Pct']
+        ),
+        'defense': rank_teams(
+            cached_all_teams_defensive_tendencies(df, filters_key),
+            ['MOFO_Pct', 'Blitz_Pct', 'Stunt_Pct', 'Man_Pct']
+        )
+    }
 
-# Calculate all teams' tendencies for ranking (without team filter)
-filters_for_ranking = filters.copy()
-filters_for_ranking['team'] = None
-all_teams_tendencies = calculate_all_teams_tendencies(df, filters_for_ranking, None)
+# Filter data for selected team
+df_filtered = cached_filter_data(df, off_team_idx, selected_team, filters_key)
+
+# Rankings only depend on the data and the situational filters, so keep them in
+# session state and rebuild only when either changes (team switches are a lookup;
+# a data reload yields a new frame and therefore a new key)
+ranks_key = (id(df), filters_key)
+if st.session_state.get('ranks_key') != ranks_key:
+    st.session_state['rank_tables'] = compute_rank_tables(filters_key)
+    st.session_state['ranks_key'] = ranks_key
+rank_tables = st.session_state['rank_tables']
+
+# Each scorecard row is emitted as a single HTML block
+def render_offensive_scorecards(overall, team_ranks):
+    """Offensive scorecards: total plays, rates with rank, top run concepts"""
+    def rank_display(metric_name):
+        return format_rank_with_color_class(team_ranks[metric_name] if team_ranks else "-")
+    
+    cards = [
+        scorecard_html(overall['total_plays'], "Total Plays"),
+        scorecard_html(f"{overall['motion_pct']:.1f}%", "Shift/Motion %", rank_display('Motion_Pct')),
+        scorecard_html(f"{overall['run_pct']:.1f}%", "Run %", rank_display('Run_Pct')),
+        scorecard_html(f"{overall['pa_pct']:.1f}%", "Play Action %", rank_display('PA_Pct')),
+        scorecard_html(f"{overall['db_pct']:.1f}%", "Standard DB %", rank_display('DB_Pct')),
+        scorecard_html(f"{overall['screen_pct']:.1f}%", "Screen %", rank_display('Screen_Pct')),
+        scorecard_list_html("Top Run Concepts", overall['top_run_concepts'])
+    ]
+    st.markdown(f'<div class="scorecard-row">{"".join(cards)}</div>', unsafe_allow_html=True)
+
+def render_defensive_scorecards(overall_def, team_ranks):
+    """Defensive scorecards: total plays, rates with rank, top coverages"""
+    def rank_display(metric_name):
+        return format_rank_with_color_class(team_ranks[metric_name] if team_ranks else "-")
+    
+    cards = [
+        scorecard_html(overall_def['total_plays'], "Total Plays"),
+        scorecard_html(f"{overall_def['mofo_pct']:.1f}%", "Middle of Field Open %", rank_display('MOFO_Pct')),
+        scorecard_html(f"{overall_def['blitz_pct']:.1f}%", "Blitz %", rank_display('Blitz_Pct')),
+        scorecard_html(f"{overall_def['stunt_pct']:.1f}%", "Stunt %", rank_display('Stunt_Pct')),
+        scorecard_html(f"{overall_def['man_pct']:.1f}%", "Man %", rank_display('Man_Pct')),
+        scorecard_list_html("Top Coverages", overall_def['top_coverages'])
+    ]
+    st.markdown(f'<div class="scorecard-row">{"".join(cards)}</div>', unsafe_allow_html=True)
 
 # Tabs
 tab1, tab2 = st.tabs(["Offense", "Defense"])
@@ -243,140 +314,41 @@ with tab1:
         st.warning("No data available for selected filters.")
     else:
         # Calculate overall tendencies
-        overall = calculate_overall_tendencies(df_filtered)
-        
-        # Calculate rankings for overall metrics
-        team_overall = all_teams_tendencies[all_teams_tendencies['Team'] == selected_team].iloc[0] if len(all_teams_tendencies[all_teams_tendencies['Team'] == selected_team]) > 0 else None
-    
-        # Function to get rank for a metric
-        def get_rank(metric_name, value):
-            if team_overall is None:
-                return "-"
-            sorted_values = all_teams_tendencies[metric_name].sort_values(ascending=False).values
-            rank = np.where(sorted_values == value)[0]
-            if len(rank) > 0:
-                rank_value = rank[0] + 1
-                tied_count = np.sum(sorted_values == value)
-                if tied_count > 1:
-                    return f"t-{rank_value}"
-                else:
-                    return str(rank_value)
-            return "-"
+        overall = cached_overall_tendencies(df, off_team_idx, selected_team, filters_key)
         
         # Display overall scorecards
         st.subheader("Overall Offensive Tendencies")
-        
-        cols = st.columns(7)
-        
-        # Total Plays
-        with cols[0]:
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall['total_plays']}</div>
-                    <div class="scorecard-label">Total Plays</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        # Motion %
-        with cols[1]:
-            motion_rank = get_rank('Motion_Pct', team_overall['Motion_Pct']) if team_overall is not None else "-"
-            rank_display = format_rank_with_color_class(motion_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall['motion_pct']:.1f}%</div>
-                    <div class="scorecard-label">Shift/Motion %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Run %
-        with cols[2]:
-            run_rank = get_rank('Run_Pct', team_overall['Run_Pct']) if team_overall is not None else "-"
-            rank_display = format_rank_with_color_class(run_rank)
-
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall['run_pct']:.1f}%</div>
-                    <div class="scorecard-label">Run %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # PA %
-        with cols[3]:
-            pa_rank = get_rank('PA_Pct', team_overall['PA_Pct']) if team_overall is not None else "-"
-            rank_display = format_rank_with_color_class(pa_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall['pa_pct']:.1f}%</div>
-                    <div class="scorecard-label">Play Action %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # DB %
-        with cols[4]:
-            db_rank = get_rank('DB_Pct', team_overall['DB_Pct']) if team_overall is not None else "-"
-            rank_display = format_rank_with_color_class(db_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall['db_pct']:.1f}%</div>
-                    <div class="scorecard-label">Standard DB %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-        # Screen %
-        with cols[5]:
-            screen_rank = get_rank('Screen_Pct', team_overall['Screen_Pct']) if team_overall is not None else "-"
-            rank_display = format_rank_with_color_class(screen_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall['screen_pct']:.1f}%</div>
-                    <div class="scorecard-label">Screen %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Top Run Concepts
-        with cols[6]:
-            concepts_display = "<br>".join(overall['top_run_concepts'][:3]) if overall['top_run_concepts'] else "N/A"
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-label" style="margin-bottom: 10px;">Top Run Concepts</div>
-                    <div style="font-size: 12px; line-height: 1.6; color: #333; margin-top: 5px;">{concepts_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
+        render_offensive_scorecards(overall, rank_tables['offense'].get(selected_team))
                 
         st.markdown("---")
 
         
+        # Create QB alignment category: Shotgun vs Under Center
+        qb_alignment = np.where(
+            df_filtered['pff_SHOTGUN'].values == 'S', 'Shotgun', 'Under Center'
+        )
+
+        # Calculate all offensive category tables in one pass over the filtered plays
+        offense_tables = calculate_category_tendencies_multi(
+            df_filtered,
+            ['pff_OFF_PERSONNEL_GROUP', 'pff_OFFFORMATIONGROUP_NORM', 'pff_OFFENSIVE_FORMATION_NAME', 'QB_Alignment'],
+            category_values={'QB_Alignment': qb_alignment}
+        )
+
         # Table 1: Personnel
         st.markdown("### Personnel Groupings")
-        personnel_df = calculate_category_tendencies(df_filtered, 'pff_OFF_PERSONNEL_GROUP')
+        personnel_df = offense_tables['pff_OFF_PERSONNEL_GROUP']
         
         if len(personnel_df) > 0:
             
-            personnel_df = personnel_df[personnel_df['Plays'] >= 10]
+            personnel_df = personnel_df[personnel_df['Plays'] >= 10].copy()
 
-            personnel_df['Usage_Display'] = personnel_df.apply(
-                lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-            )
-            personnel_df['Motion_Display'] = personnel_df.apply(
-                lambda row: f"{row['Motion_Pct']:.1f}%", axis=1
-            )
-            personnel_df['Run_Display'] = personnel_df.apply(
-                lambda row: f"{row['Run_Pct']:.1f}%", axis=1
-            )
-            personnel_df['PA_Display'] = personnel_df.apply(
-                lambda row: f"{row['PA_Pct']:.1f}%", axis=1
-            )
-            personnel_df['DB_Display'] = personnel_df.apply(
-                lambda row: f"{row['DB_Pct']:.1f}%", axis=1
-            )
-            personnel_df['Screen_Display'] = personnel_df.apply(
-                lambda row: f"{row['Screen_Pct']:.1f}%", axis=1
-            )
+            personnel_df['Usage_Display'] = format_pct(personnel_df['Usage_Pct'])
+            personnel_df['Motion_Display'] = format_pct(personnel_df['Motion_Pct'])
+            personnel_df['Run_Display'] = format_pct(personnel_df['Run_Pct'])
+            personnel_df['PA_Display'] = format_pct(personnel_df['PA_Pct'])
+            personnel_df['DB_Display'] = format_pct(personnel_df['DB_Pct'])
+            personnel_df['Screen_Display'] = format_pct(personnel_df['Screen_Pct'])
             
             # Display table
             display_df = personnel_df[[
@@ -393,36 +365,21 @@ with tab1:
                 'Top_Run_Concepts': 'Top Run Concepts'
             })
             
-            display_df_formatted = display_df.copy()
-            display_df_formatted['Top Run Concepts'] = display_df_formatted['Top Run Concepts'].str.replace('\n', ' | ')
-
-            st.markdown(df_to_html_table(display_df_formatted, "personnel-table"), unsafe_allow_html=True)
+            st.markdown(df_to_html_table(display_df, "personnel-table"), unsafe_allow_html=True)
         
         st.markdown("---")
         
         # Table 2: Formation Group
         st.markdown("### Formation Groups")
-        formation_df = calculate_category_tendencies(df_filtered, 'pff_OFFFORMATIONGROUP_NORM')
+        formation_df = offense_tables['pff_OFFFORMATIONGROUP_NORM']
         
         if len(formation_df) > 0:
-            formation_df['Usage_Display'] = formation_df.apply(
-                lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-            )
-            formation_df['Run_Display'] = formation_df.apply(
-                lambda row: f"{row['Run_Pct']:.1f}%", axis=1
-            )
-            formation_df['PA_Display'] = formation_df.apply(
-                lambda row: f"{row['PA_Pct']:.1f}%", axis=1
-            )
-            formation_df['DB_Display'] = formation_df.apply(
-                lambda row: f"{row['DB_Pct']:.1f}%", axis=1
-            )
-            formation_df['Motion_Display'] = formation_df.apply(
-                lambda row: f"{row['Motion_Pct']:.1f}%", axis=1
-            )
-            formation_df['Screen_Display'] = formation_df.apply(
-                lambda row: f"{row['Screen_Pct']:.1f}%", axis=1
-            )
+            formation_df['Usage_Display'] = format_pct(formation_df['Usage_Pct'])
+            formation_df['Run_Display'] = format_pct(formation_df['Run_Pct'])
+            formation_df['PA_Display'] = format_pct(formation_df['PA_Pct'])
+            formation_df['DB_Display'] = format_pct(formation_df['DB_Pct'])
+            formation_df['Motion_Display'] = format_pct(formation_df['Motion_Pct'])
+            formation_df['Screen_Display'] = format_pct(formation_df['Screen_Pct'])
             
             display_df = formation_df[[
                 'Category', 'Plays', 'Usage_Display', 'Motion_Display', 'Run_Display', 
@@ -438,39 +395,24 @@ with tab1:
                 'Top_Run_Concepts': 'Top Run Concepts'
             })
             
-            display_df_formatted = display_df.copy()
-            display_df_formatted['Top Run Concepts'] = display_df_formatted['Top Run Concepts'].str.replace('\n', ' | ')
-
-            st.markdown(df_to_html_table(display_df_formatted, "formation-table"), unsafe_allow_html=True)
+            st.markdown(df_to_html_table(display_df, "formation-table"), unsafe_allow_html=True)
         
         st.markdown("---")
 
         # Table 3: Formation Name (Top 10)
         st.markdown("### Formation Name (Top 10)")
-        formation_name_df = calculate_category_tendencies(df_filtered, 'pff_OFFENSIVE_FORMATION_NAME')
+        formation_name_df = offense_tables['pff_OFFENSIVE_FORMATION_NAME']
         
         if len(formation_name_df) > 0:
             # Keep only top 10 by usage
-            formation_name_df = formation_name_df.head(10)
+            formation_name_df = formation_name_df.head(10).copy()
             
-            formation_name_df['Usage_Display'] = formation_name_df.apply(
-                lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-            )
-            formation_name_df['Run_Display'] = formation_name_df.apply(
-                lambda row: f"{row['Run_Pct']:.1f}%", axis=1
-            )
-            formation_name_df['PA_Display'] = formation_name_df.apply(
-                lambda row: f"{row['PA_Pct']:.1f}%", axis=1
-            )
-            formation_name_df['DB_Display'] = formation_name_df.apply(
-                lambda row: f"{row['DB_Pct']:.1f}%", axis=1
-            )
-            formation_name_df['Screen_Display'] = formation_name_df.apply(
-                lambda row: f"{row['Screen_Pct']:.1f}%", axis=1
-            )
-            formation_name_df['Motion_Display'] = formation_name_df.apply(
-                lambda row: f"{row['Motion_Pct']:.1f}%", axis=1
-            )
+            formation_name_df['Usage_Display'] = format_pct(formation_name_df['Usage_Pct'])
+            formation_name_df['Run_Display'] = format_pct(formation_name_df['Run_Pct'])
+            formation_name_df['PA_Display'] = format_pct(formation_name_df['PA_Pct'])
+            formation_name_df['DB_Display'] = format_pct(formation_name_df['DB_Pct'])
+            formation_name_df['Screen_Display'] = format_pct(formation_name_df['Screen_Pct'])
+            formation_name_df['Motion_Display'] = format_pct(formation_name_df['Motion_Pct'])
             
             display_df = formation_name_df[[
                 'Category', 'Plays', 'Usage_Display', 'Run_Display', 
@@ -486,44 +428,22 @@ with tab1:
                 'Top_Run_Concepts': 'Top Run Concepts'
             })
             
-            # Replace newlines with separator
-            display_df_formatted = display_df.copy()
-            display_df_formatted['Top Run Concepts'] = display_df_formatted['Top Run Concepts'].str.replace('\n', ' | ')
-            
-            st.markdown(df_to_html_table(display_df_formatted, "formation-name-table"), unsafe_allow_html=True)
+            st.markdown(df_to_html_table(display_df, "formation-name-table"), unsafe_allow_html=True)
         
         st.markdown("---")
         
         # Table 4: QB Alignment
         st.markdown("### QB Alignment")
         
-       # Create QB alignment category: Shotgun vs Under Center
-        df_filtered_qb = df_filtered.copy()
-        df_filtered_qb['QB_Alignment'] = df_filtered_qb['pff_SHOTGUN'].apply(
-            lambda x: 'Shotgun' if x == 'S' else 'Under Center'
-        )
-
-        qb_df = calculate_category_tendencies(df_filtered_qb, 'QB_Alignment')
+        qb_df = offense_tables['QB_Alignment']
         
         if len(qb_df) > 0:
-            qb_df['Usage_Display'] = qb_df.apply(
-                lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-            )
-            qb_df['Run_Display'] = qb_df.apply(
-                lambda row: f"{row['Run_Pct']:.1f}%", axis=1
-            )
-            qb_df['PA_Display'] = qb_df.apply(
-                lambda row: f"{row['PA_Pct']:.1f}%", axis=1
-            )
-            qb_df['DB_Display'] = qb_df.apply(
-                lambda row: f"{row['DB_Pct']:.1f}%", axis=1
-            )
-            qb_df['Motion_Display'] = qb_df.apply(
-                lambda row: f"{row['Motion_Pct']:.1f}%", axis=1
-            )
-            qb_df['Screen_Display'] = qb_df.apply(
-                lambda row: f"{row['Screen_Pct']:.1f}%", axis=1
-            )
+            qb_df['Usage_Display'] = format_pct(qb_df['Usage_Pct'])
+            qb_df['Run_Display'] = format_pct(qb_df['Run_Pct'])
+            qb_df['PA_Display'] = format_pct(qb_df['PA_Pct'])
+            qb_df['DB_Display'] = format_pct(qb_df['DB_Pct'])
+            qb_df['Motion_Display'] = format_pct(qb_df['Motion_Pct'])
+            qb_df['Screen_Display'] = format_pct(qb_df['Screen_Pct'])
             
             display_df = qb_df[[
                 'Category', 'Plays', 'Usage_Display', 'Motion_Display', 'Run_Display', 
@@ -539,11 +459,7 @@ with tab1:
                 'Top_Run_Concepts': 'Top Run Concepts'
             })
             
-            # Convert newlines to HTML breaks for display
-            display_df_formatted = display_df.copy()
-            display_df_formatted['Top Run Concepts'] = display_df_formatted['Top Run Concepts'].str.replace('\n', ' | ')
-
-            st.markdown(df_to_html_table(display_df_formatted, "qb-alignment-table"), unsafe_allow_html=True)
+            st.markdown(df_to_html_table(display_df, "qb-alignment-table"), unsafe_allow_html=True)
         
         st.markdown("---")
         st.markdown("### Metric Definitions")
@@ -578,142 +494,18 @@ with tab2:
     st.header(f"{selected_team} Defensive Tendencies")
     
     # Filter data for defense (team as DEFTEAM)
-    filters_defense = filters.copy()
-    df_defense = df.copy()
-    
-    # Apply filters with team as DEFTEAM
-    df_defense_filtered = df_defense[df_defense['pff_DEFTEAM'] == selected_team]
-    
-    # Apply other filters
-    if filters.get('weeks') and len(filters['weeks']) > 0:
-        df_defense_filtered = df_defense_filtered[df_defense_filtered['pff_WEEK'].astype(str).isin(filters['weeks'])]
-    
-    if filters.get('quarters') and len(filters['quarters']) > 0:
-        df_defense_filtered = df_defense_filtered[df_defense_filtered['pff_QUARTER'].isin(filters['quarters'])]
-    
-    if filters.get('time_range'):
-        min_time, max_time = filters['time_range']
-        df_defense_filtered = df_defense_filtered[
-            (df_defense_filtered['minutes_remaining'] >= min_time) & 
-            (df_defense_filtered['minutes_remaining'] <= max_time)
-        ]
-    
-    if filters.get('downs') and len(filters['downs']) > 0:
-        df_defense_filtered = df_defense_filtered[df_defense_filtered['pff_DOWN'].isin(filters['downs'])]
-    
-    if filters.get('yards_to_go_range'):
-        min_ytg, max_ytg = filters['yards_to_go_range']
-        df_defense_filtered = df_defense_filtered[
-            (df_defense_filtered['pff_DISTANCE'] >= min_ytg) & 
-            (df_defense_filtered['pff_DISTANCE'] <= max_ytg)
-        ]
-    
-    if filters.get('yardline_range'):
-        min_yl, max_yl = filters['yardline_range']
-        df_defense_filtered = df_defense_filtered[
-            (df_defense_filtered['pff_YARDS_TO_GOAL_LINE'] >= min_yl) & 
-            (df_defense_filtered['pff_YARDS_TO_GOAL_LINE'] <= max_yl)
-        ]
-    
-    # Calculate all teams' defensive tendencies for ranking
-    all_teams_def_tendencies = calculate_all_teams_defensive_tendencies(df, filters_defense)
+    df_defense_filtered = cached_defensive_filter_data(df, def_team_idx, selected_team, filters_key)
     
     # Check if data exists
     if len(df_defense_filtered) == 0:
         st.warning("No defensive data available for selected filters.")
     else:
         # Calculate overall defensive tendencies
-        overall_def = calculate_defensive_overall_tendencies(df_defense_filtered)
-        
-        # Calculate rankings for overall metrics
-        team_def_overall = all_teams_def_tendencies[all_teams_def_tendencies['Team'] == selected_team].iloc[0] if len(all_teams_def_tendencies[all_teams_def_tendencies['Team'] == selected_team]) > 0 else None
-        
-        # Function to get rank for a metric
-        def get_def_rank(metric_name, value):
-            if team_def_overall is None:
-                return "-"
-            sorted_values = all_teams_def_tendencies[metric_name].sort_values(ascending=False).values
-            rank = np.where(sorted_values == value)[0]
-            if len(rank) > 0:
-                rank_value = rank[0] + 1
-                tied_count = np.sum(sorted_values == value)
-                if tied_count > 1:
-                    return f"t-{rank_value}"
-                else:
-                    return str(rank_value)
-            return "-"
+        overall_def = cached_defensive_overall_tendencies(df, def_team_idx, selected_team, filters_key)
         
         # Display defensive scorecards
         st.subheader("Overall Defensive Tendencies")
-        
-        cols = st.columns(6)
-        
-        # Total Plays
-        with cols[0]:
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall_def['total_plays']}</div>
-                    <div class="scorecard-label">Total Plays</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # MOFO %
-        with cols[1]:
-            mofo_rank = get_def_rank('MOFO_Pct', team_def_overall['MOFO_Pct']) if team_def_overall is not None else "-"
-            rank_display = format_rank_with_color_class(mofo_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall_def['mofo_pct']:.1f}%</div>
-                    <div class="scorecard-label">Middle of Field Open %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Blitz %
-        with cols[2]:
-            blitz_rank = get_def_rank('Blitz_Pct', team_def_overall['Blitz_Pct']) if team_def_overall is not None else "-"
-            rank_display = format_rank_with_color_class(blitz_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall_def['blitz_pct']:.1f}%</div>
-                    <div class="scorecard-label">Blitz %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Stunt %
-        with cols[3]:
-            stunt_rank = get_def_rank('Stunt_Pct', team_def_overall['Stunt_Pct']) if team_def_overall is not None else "-"
-            rank_display = format_rank_with_color_class(stunt_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall_def['stunt_pct']:.1f}%</div>
-                    <div class="scorecard-label">Stunt %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Man %
-        with cols[4]:
-            man_rank = get_def_rank('Man_Pct', team_def_overall['Man_Pct']) if team_def_overall is not None else "-"
-            rank_display = format_rank_with_color_class(man_rank)
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-value">{overall_def['man_pct']:.1f}%</div>
-                    <div class="scorecard-label">Man %</div>
-                    <div class="scorecard-rank">{rank_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        # Top Coverages
-        with cols[5]:
-            coverages_display = "<br>".join(overall_def['top_coverages'][:3]) if overall_def['top_coverages'] else "N/A"
-            st.markdown(f"""
-                <div class="scorecard">
-                    <div class="scorecard-label" style="margin-bottom: 10px;">Top Coverages</div>
-                    <div style="font-size: 12px; line-height: 1.6; color: #333; margin-top: 5px;">{coverages_display}</div>
-                </div>
-            """, unsafe_allow_html=True)
+        render_defensive_scorecards(overall_def, rank_tables['defense'].get(selected_team))
         
         st.markdown("---")
         
@@ -722,21 +514,11 @@ with tab2:
         def_package_df = calculate_defensive_category_tendencies(df_defense_filtered, 'pff_DEF_PACKAGE')
         
         if len(def_package_df) > 0:
-            def_package_df['Usage_Display'] = def_package_df.apply(
-                lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-            )
-            def_package_df['MOFO_Display'] = def_package_df.apply(
-                lambda row: f"{row['MOFO_Pct']:.1f}%", axis=1
-            )
-            def_package_df['Blitz_Display'] = def_package_df.apply(
-                lambda row: f"{row['Blitz_Pct']:.1f}%", axis=1
-            )
-            def_package_df['Stunt_Display'] = def_package_df.apply(
-                lambda row: f"{row['Stunt_Pct']:.1f}%", axis=1
-            )
-            def_package_df['Man_Display'] = def_package_df.apply(
-                lambda row: f"{row['Man_Pct']:.1f}%", axis=1
-            )
+            def_package_df['Usage_Display'] = format_pct(def_package_df['Usage_Pct'])
+            def_package_df['MOFO_Display'] = format_pct(def_package_df['MOFO_Pct'])
+            def_package_df['Blitz_Display'] = format_pct(def_package_df['Blitz_Pct'])
+            def_package_df['Stunt_Display'] = format_pct(def_package_df['Stunt_Pct'])
+            def_package_df['Man_Display'] = format_pct(def_package_df['Man_Pct'])
             
             display_df = def_package_df[[
                 'Category', 'Plays', 'Usage_Display', 'MOFO_Display', 
@@ -751,11 +533,7 @@ with tab2:
                 'Top_Coverages': 'Top Coverages'
             })
             
-            # Replace newlines with separator for display
-            display_df_formatted = display_df.copy()
-            display_df_formatted['Top Coverages'] = display_df_formatted['Top Coverages'].str.replace('\n', ' | ')
-            
-            st.markdown(df_to_html_table(display_df_formatted, "def-package-table"), unsafe_allow_html=True)
+            st.markdown(df_to_html_table(display_df, "def-package-table"), unsafe_allow_html=True)
         
         st.markdown("---")
 
@@ -767,21 +545,11 @@ with tab2:
 
             front_df = front_df[front_df['Plays'] >= 10]
 
-            front_df['Usage_Display'] = front_df.apply(
-                lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-            )
-            front_df['MOFO_Display'] = front_df.apply(
-                lambda row: f"{row['MOFO_Pct']:.1f}%", axis=1
-            )
-            front_df['Blitz_Display'] = front_df.apply(
-                lambda row: f"{row['Blitz_Pct']:.1f}%", axis=1
-            )
-            front_df['Stunt_Display'] = front_df.apply(
-                lambda row: f"{row['Stunt_Pct']:.1f}%", axis=1
-            )
-            front_df['Man_Display'] = front_df.apply(
-                lambda row: f"{row['Man_Pct']:.1f}%", axis=1
-            )
+            front_df['Usage_Display'] = format_pct(front_df['Usage_Pct'])
+            front_df['MOFO_Display'] = format_pct(front_df['MOFO_Pct'])
+            front_df['Blitz_Display'] = format_pct(front_df['Blitz_Pct'])
+            front_df['Stunt_Display'] = format_pct(front_df['Stunt_Pct'])
+            front_df['Man_Display'] = format_pct(front_df['Man_Pct'])
             
             display_df = front_df[[
                 'Category', 'Plays', 'Usage_Display', 'MOFO_Display', 
@@ -796,52 +564,47 @@ with tab2:
                 'Top_Coverages': 'Top Coverages'
             })
             
-            # Replace newlines with separator for display
-            display_df_formatted = display_df.copy()
-            display_df_formatted['Top Coverages'] = display_df_formatted['Top Coverages'].str.replace('\n', ' | ')
-            
-            st.markdown(df_to_html_table(display_df_formatted, "def-front-table"), unsafe_allow_html=True)
+            st.markdown(df_to_html_table(display_df, "def-front-table"), unsafe_allow_html=True)
         
         st.markdown("---")
         
         # Table 3: Defensive Package vs Offensive Personnel
         st.markdown("### Defensive Tendencies vs Offensive Personnel")
         
-        # Get all offensive personnel options (convert to string for consistency)
-        all_off_personnel = sorted(df_defense_filtered['pff_OFF_PERSONNEL_GROUP'].dropna().astype(str).unique())
+        # Group once by offensive personnel; options and the per-personnel subset both come from the groupby
+        def_grouped = df_defense_filtered.groupby('pff_OFF_PERSONNEL_GROUP', observed=True)
+        all_off_personnel = sorted(def_grouped.groups.keys(), key=str)
 
         # Default to "11" if available, otherwise first option
-        default_personnel = "11" if "11" in all_off_personnel else (all_off_personnel[0] if len(all_off_personnel) > 0 else None)
+        default_personnel = next(
+            (personnel for personnel in all_off_personnel if str(personnel) == "11"),
+            all_off_personnel[0] if len(all_off_personnel) > 0 else None
+        )
         
-        if default_personnel:
+        if default_personnel is not None:
             selected_off_personnel = st.selectbox(
                 "Select Offensive Personnel to Analyze Against",
                 options=all_off_personnel,
-                index=all_off_personnel.index(default_personnel) if default_personnel in all_off_personnel else 0
+                index=all_off_personnel.index(default_personnel),
+                format_func=str
             )
             
-            # Filter to only plays vs selected offensive personnel
-            df_vs_personnel = df_defense_filtered[df_defense_filtered['pff_OFF_PERSONNEL_GROUP'].astype(str) == selected_off_personnel]
+            # Plays vs selected offensive personnel, from the groupby's index
+            df_vs_personnel = (
+                def_grouped.get_group(selected_off_personnel)
+                if selected_off_personnel in def_grouped.groups
+                else df_defense_filtered.iloc[:0]
+            )
             
             if len(df_vs_personnel) > 0:
                 def_vs_personnel_df = calculate_defensive_category_tendencies(df_vs_personnel, 'pff_DEF_PACKAGE')
                 
                 if len(def_vs_personnel_df) > 0:
-                    def_vs_personnel_df['Usage_Display'] = def_vs_personnel_df.apply(
-                        lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_personnel_df['MOFO_Display'] = def_vs_personnel_df.apply(
-                        lambda row: f"{row['MOFO_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_personnel_df['Blitz_Display'] = def_vs_personnel_df.apply(
-                        lambda row: f"{row['Blitz_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_personnel_df['Stunt_Display'] = def_vs_personnel_df.apply(
-                        lambda row: f"{row['Stunt_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_personnel_df['Man_Display'] = def_vs_personnel_df.apply(
-                        lambda row: f"{row['Man_Pct']:.1f}%", axis=1
-                    )
+                    def_vs_personnel_df['Usage_Display'] = format_pct(def_vs_personnel_df['Usage_Pct'])
+                    def_vs_personnel_df['MOFO_Display'] = format_pct(def_vs_personnel_df['MOFO_Pct'])
+                    def_vs_personnel_df['Blitz_Display'] = format_pct(def_vs_personnel_df['Blitz_Pct'])
+                    def_vs_personnel_df['Stunt_Display'] = format_pct(def_vs_personnel_df['Stunt_Pct'])
+                    def_vs_personnel_df['Man_Display'] = format_pct(def_vs_personnel_df['Man_Pct'])
                     
                     display_df_vs = def_vs_personnel_df[[
                         'Category', 'Plays', 'Usage_Display', 'MOFO_Display',
@@ -856,11 +619,7 @@ with tab2:
                         'Top_Coverages': 'Top Coverages'
                     })
                     
-                    # Replace newlines with separator for display
-                    display_df_vs_formatted = display_df_vs.copy()
-                    display_df_vs_formatted['Top Coverages'] = display_df_vs_formatted['Top Coverages'].str.replace('\n', ' | ')
-                    
-                    st.markdown(df_to_html_table(display_df_vs_formatted, "def-package-vs-table"), unsafe_allow_html=True)
+                    st.markdown(df_to_html_table(display_df_vs, "def-package-vs-table"), unsafe_allow_html=True)
 
                 st.markdown("---")
 
@@ -870,21 +629,11 @@ with tab2:
 
                     def_vs_front_df = def_vs_front_df[def_vs_front_df['Plays'] >= 10]
 
-                    def_vs_front_df['Usage_Display'] = def_vs_front_df.apply(
-                        lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_front_df['MOFO_Display'] = def_vs_front_df.apply(
-                        lambda row: f"{row['MOFO_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_front_df['Blitz_Display'] = def_vs_front_df.apply(
-                        lambda row: f"{row['Blitz_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_front_df['Stunt_Display'] = def_vs_front_df.apply(
-                        lambda row: f"{row['Stunt_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_front_df['Man_Display'] = def_vs_front_df.apply(
-                        lambda row: f"{row['Man_Pct']:.1f}%", axis=1
-                    )
+                    def_vs_front_df['Usage_Display'] = format_pct(def_vs_front_df['Usage_Pct'])
+                    def_vs_front_df['MOFO_Display'] = format_pct(def_vs_front_df['MOFO_Pct'])
+                    def_vs_front_df['Blitz_Display'] = format_pct(def_vs_front_df['Blitz_Pct'])
+                    def_vs_front_df['Stunt_Display'] = format_pct(def_vs_front_df['Stunt_Pct'])
+                    def_vs_front_df['Man_Display'] = format_pct(def_vs_front_df['Man_Pct'])
                     
                     display_df_vs = def_vs_front_df[[
                         'Category', 'Plays', 'Usage_Display', 'MOFO_Display',
@@ -899,11 +648,7 @@ with tab2:
                         'Top_Coverages': 'Top Coverages'
                     })
                     
-                    # Replace newlines with separator for display
-                    display_df_vs_formatted = display_df_vs.copy()
-                    display_df_vs_formatted['Top Coverages'] = display_df_vs_formatted['Top Coverages'].str.replace('\n', ' | ')
-                    
-                    st.markdown(df_to_html_table(display_df_vs_formatted, "def-front-vs-table"), unsafe_allow_html=True)
+                    st.markdown(df_to_html_table(display_df_vs, "def-front-vs-table"), unsafe_allow_html=True)
 
                 else:
                     st.info(f"No defensive package data vs {selected_off_personnel}")
@@ -938,21 +683,11 @@ with tab2:
                 
                 if len(def_vs_formation_df) > 0:
 
-                    def_vs_formation_df['Usage_Display'] = def_vs_formation_df.apply(
-                        lambda row: f"{row['Usage_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_formation_df['MOFO_Display'] = def_vs_formation_df.apply(
-                        lambda row: f"{row['MOFO_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_formation_df['Blitz_Display'] = def_vs_formation_df.apply(
-                        lambda row: f"{row['Blitz_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_formation_df['Stunt_Display'] = def_vs_formation_df.apply(
-                        lambda row: f"{row['Stunt_Pct']:.1f}%", axis=1
-                    )
-                    def_vs_formation_df['Man_Display'] = def_vs_formation_df.apply(
-                        lambda row: f"{row['Man_Pct']:.1f}%", axis=1
-                    )
+                    def_vs_formation_df['Usage_Display'] = format_pct(def_vs_formation_df['Usage_Pct'])
+                    def_vs_formation_df['MOFO_Display'] = format_pct(def_vs_formation_df['MOFO_Pct'])
+                    def_vs_formation_df['Blitz_Display'] = format_pct(def_vs_formation_df['Blitz_Pct'])
+                    def_vs_formation_df['Stunt_Display'] = format_pct(def_vs_formation_df['Stunt_Pct'])
+                    def_vs_formation_df['Man_Display'] = format_pct(def_vs_formation_df['Man_Pct'])
                     
                     display_df_vs_form = def_vs_formation_df[[
                         'Category', 'Plays', 'Usage_Display', 'MOFO_Display',
@@ -967,11 +702,7 @@ with tab2:
                         'Top_Coverages': 'Top Coverages'
                     })
                     
-                    # Replace newlines with separator
-                    display_df_vs_form_formatted = display_df_vs_form.copy()
-                    display_df_vs_form_formatted['Top Coverages'] = display_df_vs_form_formatted['Top Coverages'].str.replace('\n', ' | ')
-                    
-                    st.markdown(df_to_html_table(display_df_vs_form_formatted, "def-front-vs-formation-table"), unsafe_allow_html=True)
+                    st.markdown(df_to_html_table(display_df_vs_form, "def-front-vs-formation-table"), unsafe_allow_html=True)
                 else:
                     st.info(f"No defensive front data vs {selected_off_formation}")
             else:
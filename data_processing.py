@@ -1,10 +1,76 @@
+import os
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
+
+# Source columns referenced by cleaning, calculated columns, filters and tables
+USED_COLUMNS = [
+    'pff_RUNPASS', 'pff_NOPLAY', 'pff_CLOCK', 'pff_WEEK', 'pff_QUARTER', 'pff_DOWN',
+    'pff_DISTANCE', 'pff_YARDS_TO_GOAL_LINE', 'pff_OFFTEAM', 'pff_DEFTEAM',
+    'pff_OFFFORMATIONGROUP', 'pff_OFFENSIVE_FORMATION_NAME', 'pff_OFF_PERSONNEL_GROUP',
+    'pff_SHOTGUN', 'pff_SHIFTMOTION', 'pff_SCREEN', 'pff_PLAYACTION', 'pff_DROPBACKTYPE',
+    'pff_RUNCONCEPTPRIMARY', 'pff_PASS_COVERAGE_BASIC', 'pff_BLITZDOG', 'pff_MOFOCSHOWN',
+    'pff_STUNT', 'pff_DEF_PACKAGE', 'pff_DEFENSIVE_FRONT_NAME'
+]
+
+# Column types pinned at CSV read time. The PyArrow reader infers time32 for
+# an all-"MM:SS" clock column (it comes back as datetime.time); the pin keeps it
+# text ("14:53" may arrive as "14:53:00", the leading field is still the minutes)
+CSV_DTYPES = {'pff_CLOCK': 'string'}
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORY_COLUMNS = [
+    'pff_OFFTEAM', 'pff_DEFTEAM', 'pff_OFF_PERSONNEL_GROUP', 'pff_DEF_PACKAGE',
+    'pff_SHOTGUN', 'pff_RUNPASS', 'pff_RUNCONCEPTPRIMARY', 'pff_PASS_COVERAGE_BASIC',
+    'pff_OFFFORMATIONGROUP', 'pff_MOFOCSHOWN', 'pff_DROPBACKTYPE'
+]
+
+# Season week order: regular season, then playoff rounds
+WEEK_ORDER = [str(week) for week in range(1, 19)] + ['WC', 'DP', 'CC', 'SB']
+
+# Binary play indicators used by the offensive tendency calculations
+OFFENSE_FLAG_COLUMNS = ['is_run', 'is_play_action', 'is_standard_dropback', 'has_motion', 'is_screen']
+
+# Binary play indicators used by the defensive tendency calculations
+DEFENSE_FLAG_COLUMNS = ['is_mofo', 'is_blitz', 'is_stunt', 'is_pass', 'is_man_coverage']
+
+# Columns kept after feature engineering: filter inputs, grouping columns and
+# the derived flags (raw inputs that only feed the flags are dropped)
+KEEP_COLUMNS = [
+    'pff_RUNPASS', 'pff_WEEK', 'pff_QUARTER', 'pff_DOWN', 'minutes_remaining',
+    'pff_DISTANCE', 'pff_YARDS_TO_GOAL_LINE', 'pff_OFFTEAM', 'pff_DEFTEAM',
+    'pff_OFF_PERSONNEL_GROUP', 'pff_OFFFORMATIONGROUP_NORM', 'pff_OFFENSIVE_FORMATION_NAME',
+    'pff_SHOTGUN', 'pff_RUNCONCEPTPRIMARY', 'pff_DEF_PACKAGE', 'pff_DEFENSIVE_FRONT_NAME',
+    'pff_PASS_COVERAGE_NORMALIZED'
+] + OFFENSE_FLAG_COLUMNS + DEFENSE_FLAG_COLUMNS
+
+# Ordinal suffix by rank number (1st, 2nd, 3rd, 4th, ..., 11th-13th, 21st, ...)
+_ORDINAL = tuple(
+    'th' if 10 <= i % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(i % 10, 'th')
+    for i in range(101)
+)
+
+class FilterKey(NamedTuple):
+    """Hashable snapshot of the situational filters (everything except team)"""
+    weeks: tuple
+    quarters: tuple
+    time_range: tuple
+    downs: tuple
+    yards_to_go_range: tuple
+    yardline_range: tuple
+    
+    def to_filters(self, team: str = None) -> Dict:
+        """Filter parameters dictionary as used by filter_data"""
+        return {'team': team, **self._asdict()}
+
 
 def load_data(filepath: str = None) -> pd.DataFrame:
     """
     Load PFF data from Google Drive or local CSV file.
+    A local CSV is converted once to a sibling Parquet file (rewritten whenever
+    the CSV is newer), and later loads read only USED_COLUMNS from it.
+    Parsing uses the multithreaded PyArrow CSV reader; columns stay NumPy-backed
+    since the per-rerun filter masks are faster on NumPy/categorical dtypes.
     
     Args:
         filepath: Optional local path override
@@ -13,11 +79,19 @@ def load_data(filepath: str = None) -> pd.DataFrame:
         DataFrame with raw PFF data
     """
     if filepath:
-        df = pd.read_csv(filepath)
+        parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+        if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(filepath):
+            df = pd.read_csv(filepath, engine='pyarrow', dtype=CSV_DTYPES)
+            try:
+                df.to_parquet(parquet_path, engine='pyarrow', compression='snappy')
+            except OSError:
+                # Read-only data directory: keep working from the CSV
+                return df[USED_COLUMNS]
+        df = pd.read_parquet(parquet_path, engine='pyarrow', columns=USED_COLUMNS)
     else:
         # Google Drive direct download link
         url = 'https://drive.google.com/uc?export=download&id=1ajKIPznUS228LzBhOBuhuJZbp7kDoPVw'
-        df = pd.read_csv(url)
+        df = pd.read_csv(url, engine='pyarrow', usecols=USED_COLUMNS, dtype=CSV_DTYPES)
     return df
 
 
@@ -32,32 +106,18 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Cleaned DataFrame
     """
-    # Filter to only Pass (P) or Run (R) plays
-    df_clean = df[df['pff_RUNPASS'].isin(['P', 'R'])].copy()
-    df_clean = df_clean[df_clean['pff_NOPLAY'] == 0]
-    
-    return df_clean
-
+    # Filter to only Pass (P) or Run (R) plays that weren't nullified, in one
+    # combined mask; take() builds the new frame in a single pass (no extra
+    # copy, and no chained-assignment tracking for the casts below)
+    keep = df['pff_RUNPASS'].isin(['P', 'R']).values & (df['pff_NOPLAY'].values == 0)
+    df_clean = df.take(np.flatnonzero(keep))
 
-def parse_clock_to_minutes(clock_str: str) -> int:
-    """
-    Parse pff_CLOCK string (MM:SS format) to minutes remaining in quarter.
+    # Low-cardinality strings as category so groupby/isin work on integer codes
+    # (converted after filtering so only observed values become categories)
+    for col in CATEGORY_COLUMNS:
+        df_clean[col] = df_clean[col].astype('category')
     
-    Args:
-        clock_str: Time string in MM:SS format (e.g., "14:53")
-        
-    Returns:
-        Minutes as integer
-    """
-    if pd.isna(clock_str):
-        return 0
-    
-    try:
-        parts = str(clock_str).split(':')
-        minutes = int(parts[0])
-        return minutes
-    except:
-        return 0
+    return df_clean
 
 
 def normalize_formation_group(formation: str) -> str:
@@ -101,85 +161,146 @@ def add_calculated_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     df = df.copy()
     
-    # Parse clock to seconds
-    # Parse clock to minutes
-    df['minutes_remaining'] = df['pff_CLOCK'].apply(parse_clock_to_minutes)
-    
-    # Normalize formation groups
-    df['pff_OFFFORMATIONGROUP_NORM'] = df['pff_OFFFORMATIONGROUP'].apply(normalize_formation_group)
+    # Parse clock (MM:SS) to whole minutes remaining; missing/unparseable -> 0
+    # (cast to text first: a clock PyArrow typed as time, e.g. from an older
+    # Parquet cache, renders as "14:53:00", whose leading field is the minutes)
+    df['minutes_remaining'] = pd.to_numeric(
+        df['pff_CLOCK'].astype('string').str.split(':', n=1).str[0], errors='coerce'
+    ).fillna(0).astype('int8')
+    
+    # Normalize formation groups (only a handful of distinct values, so
+    # normalize each once and map)
+    formation_norm = {
+        formation: normalize_formation_group(formation)
+        for formation in df['pff_OFFFORMATIONGROUP'].dropna().unique()
+    }
+    df['pff_OFFFORMATIONGROUP_NORM'] = df['pff_OFFFORMATIONGROUP'].map(formation_norm)
     
     # Binary indicators for tendency calculations
-    df['is_run'] = (df['pff_RUNPASS'] == 'R').astype(int)
-    df['has_motion'] = df['pff_SHIFTMOTION'].notna().astype(int)
-    df['is_screen'] = df['pff_SCREEN'].fillna(0).astype(int)
-    df['is_play_action'] = df['pff_PLAYACTION'].fillna(0).astype(int)
+    df['is_run'] = (df['pff_RUNPASS'] == 'R').astype('uint8')
+    df['has_motion'] = df['pff_SHIFTMOTION'].notna().astype('uint8')
+    df['is_screen'] = df['pff_SCREEN'].fillna(0).astype('uint8')
+    df['is_play_action'] = df['pff_PLAYACTION'].fillna(0).astype('uint8')
 
     df['is_standard_dropback'] = (
         (df['pff_DROPBACKTYPE'].isin(['SD', 'SR', 'SL'])) & 
         (df['pff_PLAYACTION'] == 0) &
         (df['pff_SCREEN'] == 0)
-    ).astype(int)
+    ).astype('uint8')
 
     # Add defensive columns
     df = add_defensive_columns(df)
+
+    # Normalize dtypes once so filters and groupbys don't re-cast on every rerun
+    # Week as an ordered categorical (1-18, then WC, DP, CC, SB) so the week
+    # list comes pre-sorted from its categories
+    week_str = df['pff_WEEK'].astype(str).where(df['pff_WEEK'].notna())
+    observed_weeks = set(week_str.dropna())
+    week_order = [w for w in WEEK_ORDER if w in observed_weeks] + sorted(observed_weeks - set(WEEK_ORDER))
+    df['pff_WEEK'] = pd.Categorical(week_str, categories=week_order, ordered=True)
+    # Quarter/down as categoricals over Int8 codes: the few distinct values are
+    # available from .cat.categories without scanning the rows
+    df['pff_QUARTER'] = df['pff_QUARTER'].astype('Int8').astype('category')
+    df['pff_DOWN'] = df['pff_DOWN'].astype('Int8').astype('category')
+    # Yardage columns fit in small integers (stays float if a value is missing)
+    for col in ['pff_DISTANCE', 'pff_YARDS_TO_GOAL_LINE']:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in ['pff_OFFFORMATIONGROUP_NORM', 'pff_PASS_COVERAGE_NORMALIZED']:
+        df[col] = df[col].astype('category')
     
-    return df
+    # Drop the raw columns nothing downstream reads
+    return df.drop(columns=df.columns.difference(KEEP_COLUMNS))
 
 
-def filter_data(df: pd.DataFrame, filters: Dict) -> pd.DataFrame:
+def prepare_data(filepath: str = None) -> pd.DataFrame:
     """
-    Apply user-selected filters to the dataset.
+    Load, clean and enrich the play feed in one step.
+    
+    Args:
+        filepath: Optional local path override (see load_data)
+        
+    Returns:
+        Cleaned DataFrame with calculated columns
+    """
+    return add_calculated_columns(clean_data(load_data(filepath)))
+
+
+def _build_filter_mask(df: pd.DataFrame, filters: Dict, include_team: bool = False,
+                       team_column: str = 'pff_OFFTEAM') -> np.ndarray:
+    """
+    Combine the user-selected filters into a single boolean row mask.
     
     Args:
         df: DataFrame with calculated columns
         filters: Dictionary of filter parameters
+        include_team: Whether to apply the team filter as well
+        team_column: Column the team filter applies to
         
     Returns:
-        Filtered DataFrame
+        Boolean NumPy array aligned with df rows
     """
-    df_filtered = df.copy()
+    mask = np.ones(len(df), dtype=bool)
     
     # Team filter
-    if filters.get('team'):
-        df_filtered = df_filtered[df_filtered['pff_OFFTEAM'] == filters['team']]
+    if include_team and filters.get('team'):
+        mask &= df[team_column].values == filters['team']
     
-   # Week filter
+    # Week filter
     if filters.get('weeks') and len(filters['weeks']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_WEEK'].astype(str).isin(filters['weeks'])]
+        mask &= df['pff_WEEK'].isin(filters['weeks']).values
     
     # Quarter filter
     if filters.get('quarters') and len(filters['quarters']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_QUARTER'].isin(filters['quarters'])]
+        mask &= df['pff_QUARTER'].isin(filters['quarters']).values
     
     # Time remaining filter
     if filters.get('time_range'):
         min_time, max_time = filters['time_range']
-        df_filtered = df_filtered[
-            (df_filtered['minutes_remaining'] >= min_time) & 
-            (df_filtered['minutes_remaining'] <= max_time)
-        ]
+        minutes = df['minutes_remaining'].values
+        mask &= (minutes >= min_time) & (minutes <= max_time)
     
     # Down filter
     if filters.get('downs') and len(filters['downs']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_DOWN'].isin(filters['downs'])]
+        mask &= df['pff_DOWN'].isin(filters['downs']).values
     
     # Yards to go filter
     if filters.get('yards_to_go_range'):
         min_ytg, max_ytg = filters['yards_to_go_range']
-        df_filtered = df_filtered[
-            (df_filtered['pff_DISTANCE'] >= min_ytg) & 
-            (df_filtered['pff_DISTANCE'] <= max_ytg)
-        ]
+        distance = df['pff_DISTANCE'].values
+        mask &= (distance >= min_ytg) & (distance <= max_ytg)
     
     # Yardline filter
     if filters.get('yardline_range'):
         min_yl, max_yl = filters['yardline_range']
-        df_filtered = df_filtered[
-            (df_filtered['pff_YARDS_TO_GOAL_LINE'] >= min_yl) & 
-            (df_filtered['pff_YARDS_TO_GOAL_LINE'] <= max_yl)
-        ]
+        yards_to_goal = df['pff_YARDS_TO_GOAL_LINE'].values
+        mask &= (yards_to_goal >= min_yl) & (yards_to_goal <= max_yl)
     
-    return df_filtered
+    return mask
+
+
+def filter_data(df: pd.DataFrame, filters: Dict, team_index: Dict = None,
+                team_column: str = 'pff_OFFTEAM') -> pd.DataFrame:
+    """
+    Apply user-selected filters to the dataset.
+    
+    Args:
+        df: DataFrame with calculated columns
+        filters: Dictionary of filter parameters
+        team_index: Optional mapping of team to row positions
+            (from groupby(...).indices); when given, the team's rows are taken
+            directly instead of scanning the full frame
+        team_column: Column the team filter applies to ('pff_DEFTEAM' for
+            the defensive view)
+        
+    Returns:
+        Filtered DataFrame
+    """
+    # Team filter: take the team's rows directly when an index is available
+    if filters.get('team') and team_index is not None:
+        team_df = df.iloc[team_index.get(filters['team'], [])]
+        return team_df[_build_filter_mask(team_df, filters)]
+    
+    return df[_build_filter_mask(df, filters, include_team=True, team_column=team_column)]
 
 
 def calculate_overall_tendencies(df: pd.DataFrame) -> Dict:
@@ -205,12 +326,13 @@ def calculate_overall_tendencies(df: pd.DataFrame) -> Dict:
             'top_run_concepts': []
         }
     
-    # Calculate percentages
-    run_pct = (df['is_run'].sum() / total_plays) * 100
-    pa_pct = (df['is_play_action'].sum() / total_plays) * 100
-    db_pct = (df['is_standard_dropback'].sum() / total_plays) * 100
-    motion_pct = (df['has_motion'].sum() / total_plays) * 100
-    screen_pct = (df['is_screen'].sum() / total_plays) * 100
+    # Calculate percentages (one column-wise sum over all the flags)
+    flag_pcts = df[OFFENSE_FLAG_COLUMNS].sum() / total_plays * 100
+    run_pct = flag_pcts['is_run']
+    pa_pct = flag_pcts['is_play_action']
+    db_pct = flag_pcts['is_standard_dropback']
+    motion_pct = flag_pcts['has_motion']
+    screen_pct = flag_pcts['is_screen']
     
     # Get top 3 run concepts
     run_plays = df[df['is_run'] == 1]
@@ -218,6 +340,7 @@ def calculate_overall_tendencies(df: pd.DataFrame) -> Dict:
     
     if len(run_plays) > 0:
         run_concept_counts = run_plays['pff_RUNCONCEPTPRIMARY'].value_counts()
+        run_concept_counts = run_concept_counts[run_concept_counts > 0]  # drop unobserved categories
         for concept, count in run_concept_counts.head(3).items():
             pct = (count / len(run_plays)) * 100
             top_run_concepts.append(f"{concept} ({pct:.1f}%)")
@@ -232,13 +355,43 @@ def calculate_overall_tendencies(df: pd.DataFrame) -> Dict:
     }
 
 
-def calculate_category_tendencies(df: pd.DataFrame, category_column: str) -> pd.DataFrame:
+def _top_shares(counts: pd.Series, totals: pd.Series, separator: str, n: int = 3) -> pd.Series:
+    """
+    Label the most frequent values within each group with their share of the group.
+    
+    Args:
+        counts: Play counts indexed by (group, value)
+        totals: Denominator for each group (e.g., the group's run plays)
+        separator: String used to join a group's labels
+        n: Number of values to keep per group
+        
+    Returns:
+        Series indexed by group with joined labels like "INSIDE ZONE (42.9%)",
+        most frequent first
+    """
+    # One stable sort over every (group, value) pair, then keep the first n
+    # per group (equivalent to a per-group nlargest without a Python call per group)
+    counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+    top = counts.groupby(level=0, observed=True, sort=False).head(n)
+    pct = top / totals.reindex(top.index.get_level_values(0)).to_numpy() * 100
+    
+    values = pd.Series(top.index.get_level_values(1).astype(str), index=top.index)
+    labels = values + ' (' + pct.map('{:.1f}%)'.format)
+    return labels.groupby(level=0, observed=True, sort=False).agg(separator.join)
+
+
+def calculate_category_tendencies(df: pd.DataFrame, category_column: str,
+                                  category_values: np.ndarray = None,
+                                  separator: str = ' | ') -> pd.DataFrame:
     """
     Calculate tendencies broken down by a specific category (Personnel, Formation, QB Alignment).
     
     Args:
         df: Filtered DataFrame for selected team
         category_column: Column name to group by (e.g., 'pff_OFFPERSONNELBASIC')
+        category_values: Optional per-play category values to group by instead
+            of a column (e.g., derived QB alignment), aligned with df rows
+        separator: String used to join the top run concepts
         
     Returns:
         DataFrame with tendency metrics by category
@@ -249,44 +402,36 @@ def calculate_category_tendencies(df: pd.DataFrame, category_column: str) -> pd.
     total_team_plays = len(df)
     
     # Group by category
-    grouped = df.groupby(category_column)
-    
-    results = []
-    
-    for category, group in grouped:
-        category_plays = len(group)
-        
-        # Calculate percentages
-        usage_pct = (category_plays / total_team_plays) * 100
-        run_pct = (group['is_run'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        pa_pct = (group['is_play_action'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        db_pct = (group['is_standard_dropback'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        motion_pct = (group['has_motion'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        screen_pct = (group['is_screen'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        
-        # Get top 3 run concepts for this category
-        run_plays = group[group['is_run'] == 1]
-        top_run_concepts = []
-        
-        if len(run_plays) > 0:
-            run_concept_counts = run_plays['pff_RUNCONCEPTPRIMARY'].value_counts()
-            for concept, count in run_concept_counts.head(3).items():
-                pct = (count / len(run_plays)) * 100
-                top_run_concepts.append(f"{concept} ({pct:.1f}%)")
-        
-        results.append({
-            'Category': category,
-            'Plays': category_plays,
-            'Usage_Pct': usage_pct,
-            'Run_Pct': run_pct,
-            'PA_Pct': pa_pct,
-            'DB_Pct': db_pct,
-            'Motion_Pct': motion_pct,
-            'Screen_Pct': screen_pct,
-            'Top_Run_Concepts': '\n'.join(top_run_concepts) if top_run_concepts else ''
-        })
-    
-    result_df = pd.DataFrame(results)
+    keys = df[category_column] if category_values is None else pd.Series(category_values, index=df.index)
+    grouped = df.groupby(keys, observed=True)
+    
+    # Play counts and flag sums for every category in one pass
+    summary = grouped.agg(
+        Plays=('is_run', 'size'),
+        Runs=('is_run', 'sum'),
+        PA=('is_play_action', 'sum'),
+        DB=('is_standard_dropback', 'sum'),
+        Motion=('has_motion', 'sum'),
+        Screen=('is_screen', 'sum')
+    )
+    plays = summary['Plays']
+    
+    # Get top 3 run concepts for each category (share of that category's run plays)
+    run_mask = df['is_run'].values == 1
+    concept_counts = df[run_mask].groupby([keys[run_mask], 'pff_RUNCONCEPTPRIMARY'], observed=True).size()
+    top_run_concepts = _top_shares(concept_counts, summary['Runs'], separator)
+    
+    result_df = pd.DataFrame({
+        'Category': summary.index.to_numpy(),
+        'Plays': plays.to_numpy(),
+        'Usage_Pct': (plays / total_team_plays * 100).to_numpy(),
+        'Run_Pct': (summary['Runs'] / plays * 100).to_numpy(),
+        'PA_Pct': (summary['PA'] / plays * 100).to_numpy(),
+        'DB_Pct': (summary['DB'] / plays * 100).to_numpy(),
+        'Motion_Pct': (summary['Motion'] / plays * 100).to_numpy(),
+        'Screen_Pct': (summary['Screen'] / plays * 100).to_numpy(),
+        'Top_Run_Concepts': top_run_concepts.reindex(summary.index, fill_value='').to_numpy()
+    })
     
     # Sort by usage percentage (descending)
     result_df = result_df.sort_values('Usage_Pct', ascending=False).reset_index(drop=True)
@@ -294,6 +439,34 @@ def calculate_category_tendencies(df: pd.DataFrame, category_column: str) -> pd.
     return result_df
 
 
+def calculate_category_tendencies_multi(df: pd.DataFrame, group_cols: List[str],
+                                        category_values: Dict[str, np.ndarray] = None,
+                                        separator: str = ' | ') -> Dict[str, pd.DataFrame]:
+    """
+    Calculate category tendencies for several groupings of the same plays in one call.
+    The flag and run concept columns are projected once and shared by every grouping.
+    
+    Args:
+        df: Filtered DataFrame for selected team
+        group_cols: Column names to group by (or keys of category_values)
+        category_values: Optional derived per-play category values keyed by name
+            (e.g., {'QB_Alignment': ...}), aligned with df rows
+        separator: String used to join the top run concepts
+        
+    Returns:
+        Dictionary mapping each grouping to its DataFrame of tendency metrics
+    """
+    category_values = category_values or {}
+    shared_df = df[OFFENSE_FLAG_COLUMNS + ['pff_RUNCONCEPTPRIMARY']]
+    
+    tables = {}
+    for col in group_cols:
+        values = category_values[col] if col in category_values else df[col].values
+        tables[col] = calculate_category_tendencies(shared_df, col, category_values=values, separator=separator)
+    
+    return tables
+
+
 def calculate_all_teams_tendencies(df: pd.DataFrame, filters: Dict, category_column: str) -> pd.DataFrame:
     """
     Calculate tendencies for all teams to enable ranking.
@@ -307,69 +480,28 @@ def calculate_all_teams_tendencies(df: pd.DataFrame, filters: Dict, category_col
         DataFrame with all teams' tendencies aggregated
     """
     # Apply all filters except team filter
-    df_filtered = df.copy()
-    
-    # Week filter
-    if filters.get('weeks') and len(filters['weeks']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_WEEK'].astype(str).isin(filters['weeks'])]
-    
-    # Quarter filter
-    if filters.get('quarters') and len(filters['quarters']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_QUARTER'].isin(filters['quarters'])]
-    
-    # Time remaining filter
-    if filters.get('time_range'):
-        min_time, max_time = filters['time_range']
-        df_filtered = df_filtered[
-            (df_filtered['minutes_remaining'] >= min_time) & 
-            (df_filtered['minutes_remaining'] <= max_time)
-        ]
-    
-    # Down filter
-    if filters.get('downs') and len(filters['downs']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_DOWN'].isin(filters['downs'])]
-    
-    # Yards to go filter
-    if filters.get('yards_to_go_range'):
-        min_ytg, max_ytg = filters['yards_to_go_range']
-        df_filtered = df_filtered[
-            (df_filtered['pff_DISTANCE'] >= min_ytg) & 
-            (df_filtered['pff_DISTANCE'] <= max_ytg)
-        ]
-    
-    # Yardline filter
-    if filters.get('yardline_range'):
-        min_yl, max_yl = filters['yardline_range']
-        df_filtered = df_filtered[
-            (df_filtered['pff_YARDS_TO_GOAL_LINE'] >= min_yl) & 
-            (df_filtered['pff_YARDS_TO_GOAL_LINE'] <= max_yl)
-        ]
-    
-    # Calculate tendencies for each team
-    all_teams_data = []
-    
-    for team in df_filtered['pff_OFFTEAM'].unique():
-        team_df = df_filtered[df_filtered['pff_OFFTEAM'] == team]
-        
-        if len(team_df) == 0:
-            continue
-        
-        total_plays = len(team_df)
-        
-        # Overall metrics
-        overall_metrics = {
-            'Team': team,
-            'Total_Plays': total_plays,
-            'Run_Pct': (team_df['is_run'].sum() / total_plays) * 100,
-            'PA_Pct': (team_df['is_play_action'].sum() / total_plays) * 100,
-            'DB_Pct': (team_df['is_standard_dropback'].sum() / total_plays) * 100,
-            'Motion_Pct': (team_df['has_motion'].sum() / total_plays) * 100,
-            'Screen_Pct': (team_df['is_screen'].sum() / total_plays) * 100
-        }
-        
-        all_teams_data.append(overall_metrics)
-    
-    return pd.DataFrame(all_teams_data)
+    df_filtered = df[_build_filter_mask(df, filters)]
+    
+    # Calculate tendencies for every team in one grouped pass
+    team_totals = df_filtered.groupby('pff_OFFTEAM', observed=True, sort=False).agg(
+        Total_Plays=('is_run', 'size'),
+        Runs=('is_run', 'sum'),
+        PA=('is_play_action', 'sum'),
+        DB=('is_standard_dropback', 'sum'),
+        Motion=('has_motion', 'sum'),
+        Screen=('is_screen', 'sum')
+    )
+    total_plays = team_totals['Total_Plays']
+    
+    return pd.DataFrame({
+        'Team': team_totals.index.to_numpy(),
+        'Total_Plays': total_plays.to_numpy(),
+        'Run_Pct': (team_totals['Runs'] / total_plays * 100).to_numpy(),
+        'PA_Pct': (team_totals['PA'] / total_plays * 100).to_numpy(),
+        'DB_Pct': (team_totals['DB'] / total_plays * 100).to_numpy(),
+        'Motion_Pct': (team_totals['Motion'] / total_plays * 100).to_numpy(),
+        'Screen_Pct': (team_totals['Screen'] / total_plays * 100).to_numpy()
+    })
 
 
 def add_rankings(team_df: pd.DataFrame, all_teams_df: pd.DataFrame, metrics: List[str]) -> pd.DataFrame:
@@ -390,35 +522,66 @@ def add_rankings(team_df: pd.DataFrame, all_teams_df: pd.DataFrame, metrics: Lis
         if metric not in df.columns or metric not in all_teams_df.columns:
             continue
         
-        # For each row in team_df, calculate rank
-        rankings = []
+        # Rank every distinct value once (highest = 1, ties share the lowest
+        # rank), then look the team's values up; values not found get "-"
+        all_values = all_teams_df[metric]
+        ranks = all_values.rank(ascending=False, method='min')
+        rank_by_value = pd.Series(ranks.to_numpy(), index=all_values.to_numpy()).dropna()
+        rank_by_value = rank_by_value[~rank_by_value.index.duplicated()].astype(int).astype(str)
+        tied = all_values.value_counts().reindex(rank_by_value.index)
+        rank_labels = rank_by_value.where(tied <= 1, 't-' + rank_by_value)
         
-        for idx, row in df.iterrows():
-            value = row[metric]
-            
-            # Count how many teams have higher value (descending rank)
-            sorted_values = all_teams_df[metric].sort_values(ascending=False).values
-            
-            # Find rank (1-indexed)
-            rank = np.where(sorted_values == value)[0]
-            
-            if len(rank) > 0:
-                rank_value = rank[0] + 1
-                
-                # Check for ties
-                tied_count = np.sum(sorted_values == value)
-                if tied_count > 1:
-                    rankings.append(f"t-{rank_value}")
-                else:
-                    rankings.append(f"{rank_value}")
-            else:
-                rankings.append("-")
+        df[f'{metric}_Rank'] = df[metric].map(rank_labels).fillna('-')
+    
+    return df
+
+
+def _attach_ranks(all_teams_df: pd.DataFrame, metrics: List[str]) -> pd.DataFrame:
+    """
+    Add rank columns for each metric, computed once for all teams.
+    
+    Args:
+        all_teams_df: DataFrame with all teams' tendencies (one row per team)
+        metrics: List of metric column names to rank
         
-        df[f'{metric}_Rank'] = rankings
+    Returns:
+        Copy of all_teams_df with {metric}_rank (highest value = 1, ties share
+        the lowest rank) and {metric}_tied (teams sharing the value) columns
+    """
+    df = all_teams_df.copy()
+    
+    for metric in metrics:
+        values = df[metric]
+        df[f'{metric}_rank'] = values.rank(ascending=False, method='min').astype(int)
+        df[f'{metric}_tied'] = values.map(values.value_counts())
     
     return df
 
 
+def rank_teams(all_teams_df: pd.DataFrame, metrics: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Rank every team on each metric so scorecard ranks become dictionary lookups.
+    
+    Args:
+        all_teams_df: DataFrame with all teams' tendencies (one row per team)
+        metrics: List of metric column names to rank
+        
+    Returns:
+        Dictionary mapping team to {metric: rank string (e.g., "12" or "t-12")}
+    """
+    if len(all_teams_df) == 0:
+        return {}
+    
+    ranked = _attach_ranks(all_teams_df, metrics).set_index('Team')
+    
+    rank_labels = {}
+    for metric in metrics:
+        ranks = ranked[f'{metric}_rank'].astype(str)
+        rank_labels[metric] = ranks.where(ranked[f'{metric}_tied'] <= 1, 't-' + ranks)
+    
+    return pd.DataFrame(rank_labels).to_dict(orient='index')
+
+
 def format_percentage_with_rank(value: float, rank: str) -> str:
     """
     Format percentage with rank for display.
@@ -443,38 +606,24 @@ def format_percentage_with_rank(value: float, rank: str) -> str:
         return f"{value:.1f}% (t-{rank_num}th)"
     else:
         # Add ordinal suffix (st, nd, rd, th)
-        if rank_num.endswith('1') and rank_num != '11':
-            suffix = 'st'
-        elif rank_num.endswith('2') and rank_num != '12':
-            suffix = 'nd'
-        elif rank_num.endswith('3') and rank_num != '13':
-            suffix = 'rd'
-        else:
-            suffix = 'th'
+        suffix = _ORDINAL[int(rank_num) % 100]
         
         return f"{value:.1f}% ({rank_num}{suffix})"
     
-def parse_pass_rushers(rushers_str: str) -> int:
+def parse_pass_rushers(rushers: pd.Series) -> pd.Series:
     """
     Parse pff_PASSRUSHPLAYERS to extract number of pass rushers.
     Format: "4; PHI 53 (LILB); PHI 90 (NRT); PHI 94 (RE); PHI 97 (DLT)"
     
     Args:
-        rushers_str: String with number of rushers and player details
+        rushers: Series of strings with number of rushers and player details
         
     Returns:
-        Number of pass rushers as integer
+        Series with number of pass rushers as int8 (0 when missing/unparseable)
     """
-    if pd.isna(rushers_str):
-        return 0
-    
-    try:
-        # Split by semicolon and get first element
-        parts = str(rushers_str).split(';')
-        num_rushers = int(parts[0].strip())
-        return num_rushers
-    except:
-        return 0
+    # Only the leading count is needed, so split off the first token only
+    counts = rushers.astype('string').str.split(';', n=1).str[0].str.strip()
+    return pd.to_numeric(counts, errors='coerce').fillna(0).astype('int8')
 
 
 def is_man_coverage(coverage: str) -> bool:
@@ -526,20 +675,32 @@ def add_defensive_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     df = df.copy()
     
+    # Coverage labels have only a handful of distinct values, so classify each
+    # once and map the results onto the rows
+    coverages = df['pff_PASS_COVERAGE_BASIC'].dropna().unique()
+    coverage_norm = {coverage: normalize_coverage(coverage) for coverage in coverages}
+    man_coverages = [coverage for coverage in coverages if is_man_coverage(coverage)]
+    
     # Normalize coverage names
-    df['pff_PASS_COVERAGE_NORMALIZED'] = df['pff_PASS_COVERAGE_BASIC'].apply(normalize_coverage)
+    df['pff_PASS_COVERAGE_NORMALIZED'] = df['pff_PASS_COVERAGE_BASIC'].map(coverage_norm)
     
+    # Flags below are stored by reinterpreting the boolean mask's bytes as
+    # uint8 (.view), rather than converting through a second array
     # Binary: Is blitz (from pff_BLITZDOG column, across ALL plays)
-    df['is_blitz'] = (df['pff_BLITZDOG'] == 1).astype(int)
+    df['is_blitz'] = (df['pff_BLITZDOG'].to_numpy() == 1).view('u1')
     
     # Binary: Is MOFO shown (Middle of Field Open - what defense shows pre-snap, across ALL plays)
-    df['is_mofo'] = (df['pff_MOFOCSHOWN'] == 'O').astype(int)
+    df['is_mofo'] = (df['pff_MOFOCSHOWN'] == 'O').to_numpy().view('u1')
     
     # Binary: Is stunt (defensive line stunt, across ALL plays)
-    df['is_stunt'] = (df['pff_STUNT'] == 1).astype(int)
+    df['is_stunt'] = (df['pff_STUNT'].to_numpy() == 1).view('u1')
+    
+    # Binary: Is pass play (denominator for the pass-only coverage metrics)
+    is_pass = (df['pff_RUNPASS'] == 'P').to_numpy()
+    df['is_pass'] = is_pass.view('u1')
     
-    # Binary: Is man coverage (pass plays only)
-    df['is_man_coverage'] = df['pff_PASS_COVERAGE_BASIC'].apply(is_man_coverage).astype(int)
+    # Binary: Is man coverage (pass plays only; missing coverage is not man)
+    df['is_man_coverage'] = (df['pff_PASS_COVERAGE_BASIC'].isin(man_coverages).to_numpy() & is_pass).view('u1')
     
     return df
 
@@ -555,8 +716,6 @@ def calculate_defensive_overall_tendencies(df: pd.DataFrame) -> Dict:
         Dictionary with overall defensive tendency metrics
     """
     total_plays = len(df)
-    pass_plays = df[df['pff_RUNPASS'] == 'P']
-    total_pass_plays = len(pass_plays)
     
     if total_plays == 0:
         return {
@@ -568,22 +727,27 @@ def calculate_defensive_overall_tendencies(df: pd.DataFrame) -> Dict:
             'top_coverages': []
         }
     
-    # Calculate percentages
+    # Calculate percentages (one column-wise sum over all the flags)
+    flag_sums = df[DEFENSE_FLAG_COLUMNS].sum()
+    total_pass_plays = int(flag_sums['is_pass'])
+    
     # MOFO, Blitz, Stunt: all plays
-    mofo_pct = (df['is_mofo'].sum() / total_plays) * 100
-    blitz_pct = (df['is_blitz'].sum() / total_plays) * 100
-    stunt_pct = (df['is_stunt'].sum() / total_plays) * 100
+    mofo_pct = (flag_sums['is_mofo'] / total_plays) * 100
+    blitz_pct = (flag_sums['is_blitz'] / total_plays) * 100
+    stunt_pct = (flag_sums['is_stunt'] / total_plays) * 100
     
-    # Man coverage: pass plays only
+    # Man coverage: pass plays only (is_man_coverage is 0 on non-pass plays)
     if total_pass_plays > 0:
-        man_pct = (pass_plays['is_man_coverage'].sum() / total_pass_plays) * 100
+        man_pct = (flag_sums['is_man_coverage'] / total_pass_plays) * 100
     else:
         man_pct = 0
     
     # Get top 3 coverages (pass plays only)
     top_coverages = []
     if total_pass_plays > 0:
-        coverage_counts = pass_plays['pff_PASS_COVERAGE_NORMALIZED'].value_counts()
+        pass_mask = df['is_pass'].values == 1
+        coverage_counts = df['pff_PASS_COVERAGE_NORMALIZED'][pass_mask].value_counts()
+        coverage_counts = coverage_counts[coverage_counts > 0]  # drop unobserved categories
         for coverage, count in coverage_counts.head(3).items():
             pct = (count / total_pass_plays) * 100
             top_coverages.append(f"{coverage} ({pct:.1f}%)")
@@ -598,13 +762,15 @@ def calculate_defensive_overall_tendencies(df: pd.DataFrame) -> Dict:
     }
 
 
-def calculate_defensive_category_tendencies(df: pd.DataFrame, category_column: str) -> pd.DataFrame:
+def calculate_defensive_category_tendencies(df: pd.DataFrame, category_column: str,
+                                            separator: str = ' | ') -> pd.DataFrame:
     """
     Calculate defensive tendencies broken down by category (e.g., Defensive Package).
     
     Args:
         df: Filtered DataFrame for selected team
         category_column: Column name to group by (e.g., 'pff_DEF_PACKAGE')
+        separator: String used to join the top coverages
         
     Returns:
         DataFrame with defensive tendency metrics by category
@@ -615,49 +781,39 @@ def calculate_defensive_category_tendencies(df: pd.DataFrame, category_column: s
     total_team_plays = len(df)
     
     # Group by category
-    grouped = df.groupby(category_column)
-    
-    results = []
-    
-    for category, group in grouped:
-        category_plays = len(group)
-        pass_plays = group[group['pff_RUNPASS'] == 'P']
-        total_pass_plays = len(pass_plays)
-        
-        # Calculate percentages
-        usage_pct = (category_plays / total_team_plays) * 100
-        
-        # MOFO, Blitz, Stunt: all plays
-        mofo_pct = (group['is_mofo'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        blitz_pct = (group['is_blitz'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        stunt_pct = (group['is_stunt'].sum() / category_plays) * 100 if category_plays > 0 else 0
-        
-        # Man coverage: pass plays only
-        if total_pass_plays > 0:
-            man_pct = (pass_plays['is_man_coverage'].sum() / total_pass_plays) * 100
-        else:
-            man_pct = 0
-        
-        # Get top 3 coverages for this category (pass plays only)
-        top_coverages = []
-        if total_pass_plays > 0:
-            coverage_counts = pass_plays['pff_PASS_COVERAGE_NORMALIZED'].value_counts()
-            for coverage, count in coverage_counts.head(3).items():
-                pct = (count / total_pass_plays) * 100
-                top_coverages.append(f"{coverage} ({pct:.1f}%)")
-        
-        results.append({
-            'Category': category,
-            'Plays': category_plays,
-            'Usage_Pct': usage_pct,
-            'MOFO_Pct': mofo_pct,
-            'Blitz_Pct': blitz_pct,
-            'Stunt_Pct': stunt_pct,
-            'Man_Pct': man_pct,
-            'Top_Coverages': '\n'.join(top_coverages) if top_coverages else ''
-        })
-    
-    result_df = pd.DataFrame(results)
+    grouped = df.groupby(category_column, observed=True)
+    
+    # MOFO, Blitz, Stunt: all plays; Man coverage: pass plays only
+    # (is_man_coverage is 0 on non-pass plays, so both sums come from one pass)
+    summary = grouped.agg(
+        Plays=('is_mofo', 'size'),
+        MOFO=('is_mofo', 'sum'),
+        Blitz=('is_blitz', 'sum'),
+        Stunt=('is_stunt', 'sum'),
+        Pass_Plays=('is_pass', 'sum'),
+        Man=('is_man_coverage', 'sum')
+    )
+    plays = summary['Plays']
+    pass_counts = summary['Pass_Plays']
+    man_pct = (summary['Man'] / pass_counts * 100).where(pass_counts > 0, 0)
+    
+    # Get top 3 coverages for each category (share of that category's pass plays)
+    pass_plays = df.loc[df['is_pass'].values == 1, [category_column, 'pff_PASS_COVERAGE_NORMALIZED']]
+    coverage_counts = pass_plays.groupby(
+        [category_column, 'pff_PASS_COVERAGE_NORMALIZED'], observed=True
+    ).size()
+    top_coverages = _top_shares(coverage_counts, pass_counts, separator)
+    
+    result_df = pd.DataFrame({
+        'Category': summary.index.to_numpy(),
+        'Plays': plays.to_numpy(),
+        'Usage_Pct': (plays / total_team_plays * 100).to_numpy(),
+        'MOFO_Pct': (summary['MOFO'] / plays * 100).to_numpy(),
+        'Blitz_Pct': (summary['Blitz'] / plays * 100).to_numpy(),
+        'Stunt_Pct': (summary['Stunt'] / plays * 100).to_numpy(),
+        'Man_Pct': man_pct.to_numpy(),
+        'Top_Coverages': top_coverages.reindex(summary.index, fill_value='').to_numpy()
+    })
     
     # Sort by usage percentage (descending)
     result_df = result_df.sort_values('Usage_Pct', ascending=False).reset_index(drop=True)
@@ -677,72 +833,30 @@ def calculate_all_teams_defensive_tendencies(df: pd.DataFrame, filters: Dict) ->
         DataFrame with all teams' defensive tendencies aggregated
     """
     # Apply all filters except team filter
-    df_filtered = df.copy()
-    
-    if filters.get('weeks') and len(filters['weeks']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_WEEK'].astype(str).isin(filters['weeks'])]
-    
-    if filters.get('quarters') and len(filters['quarters']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_QUARTER'].isin(filters['quarters'])]
-    
-    if filters.get('time_range'):
-        min_time, max_time = filters['time_range']
-        df_filtered = df_filtered[
-            (df_filtered['minutes_remaining'] >= min_time) & 
-            (df_filtered['minutes_remaining'] <= max_time)
-        ]
-    
-    if filters.get('downs') and len(filters['downs']) > 0:
-        df_filtered = df_filtered[df_filtered['pff_DOWN'].isin(filters['downs'])]
-    
-    if filters.get('yards_to_go_range'):
-        min_ytg, max_ytg = filters['yards_to_go_range']
-        df_filtered = df_filtered[
-            (df_filtered['pff_DISTANCE'] >= min_ytg) & 
-            (df_filtered['pff_DISTANCE'] <= max_ytg)
-        ]
-    
-    if filters.get('yardline_range'):
-        min_yl, max_yl = filters['yardline_range']
-        df_filtered = df_filtered[
-            (df_filtered['pff_YARDS_TO_GOAL_LINE'] >= min_yl) & 
-            (df_filtered['pff_YARDS_TO_GOAL_LINE'] <= max_yl)
-        ]
-    
-    # Calculate defensive tendencies for each team
-    all_teams_data = []
-    
-    for team in df_filtered['pff_DEFTEAM'].unique():
-        team_df = df_filtered[df_filtered['pff_DEFTEAM'] == team]
-        
-        if len(team_df) == 0:
-            continue
-        
-        total_plays = len(team_df)
-        pass_plays = team_df[team_df['pff_RUNPASS'] == 'P']
-        total_pass_plays = len(pass_plays)
-        
-        # MOFO, Blitz, Stunt: all plays
-        mofo_pct = (team_df['is_mofo'].sum() / total_plays) * 100
-        blitz_pct = (team_df['is_blitz'].sum() / total_plays) * 100
-        stunt_pct = (team_df['is_stunt'].sum() / total_plays) * 100
-        
-        # Man coverage: pass plays only
-        if total_pass_plays > 0:
-            man_pct = (pass_plays['is_man_coverage'].sum() / total_pass_plays) * 100
-        else:
-            man_pct = 0
-        
-        all_teams_data.append({
-            'Team': team,
-            'Total_Plays': total_plays,
-            'MOFO_Pct': mofo_pct,
-            'Blitz_Pct': blitz_pct,
-            'Stunt_Pct': stunt_pct,
-            'Man_Pct': man_pct
-        })
-    
-    return pd.DataFrame(all_teams_data)
+    df_filtered = df[_build_filter_mask(df, filters)]
+    
+    # Calculate defensive tendencies for every team in one grouped pass
+    # MOFO, Blitz, Stunt: all plays; Man coverage: pass plays only
+    team_totals = df_filtered.groupby('pff_DEFTEAM', observed=True, sort=False).agg(
+        Total_Plays=('is_mofo', 'size'),
+        MOFO=('is_mofo', 'sum'),
+        Blitz=('is_blitz', 'sum'),
+        Stunt=('is_stunt', 'sum'),
+        Pass_Plays=('is_pass', 'sum'),
+        Man=('is_man_coverage', 'sum')
+    )
+    total_plays = team_totals['Total_Plays']
+    pass_counts = team_totals['Pass_Plays']
+    man_pct = (team_totals['Man'] / pass_counts * 100).where(pass_counts > 0, 0)
+    
+    return pd.DataFrame({
+        'Team': team_totals.index.to_numpy(),
+        'Total_Plays': total_plays.to_numpy(),
+        'MOFO_Pct': (team_totals['MOFO'] / total_plays * 100).to_numpy(),
+        'Blitz_Pct': (team_totals['Blitz'] / total_plays * 100).to_numpy(),
+        'Stunt_Pct': (team_totals['Stunt'] / total_plays * 100).to_numpy(),
+        'Man_Pct': man_pct.to_numpy()
+    })
 
 # Convert to yards ranges
 def yardline_bucket_to_range(buckets):
@@ -814,6 +928,56 @@ def df_to_html_table(df, table_id="table"):
     
     return html
 
+def scorecard_html(value, label: str, rank_display: str = None) -> str:
+    """
+    Build HTML for a single scorecard.
+    
+    Args:
+        value: Value to display (e.g., "45.2%")
+        label: Metric label
+        rank_display: Optional rank HTML from format_rank_with_color_class
+        
+    Returns:
+        HTML string for the scorecard
+    """
+    html = f'<div class="scorecard"><div class="scorecard-value">{value}</div>'
+    html += f'<div class="scorecard-label">{label}</div>'
+    if rank_display is not None:
+        html += f'<div class="scorecard-rank">{rank_display}</div>'
+    html += '</div>'
+    
+    return html
+
+def scorecard_list_html(label: str, items: List[str]) -> str:
+    """
+    Build HTML for a scorecard listing up to three items (e.g., top run concepts).
+    
+    Args:
+        label: Scorecard label
+        items: Items to list
+        
+    Returns:
+        HTML string for the scorecard
+    """
+    items_display = "<br>".join(items[:3]) if items else "N/A"
+    html = f'<div class="scorecard"><div class="scorecard-label" style="margin-bottom: 10px;">{label}</div>'
+    html += f'<div style="font-size: 12px; line-height: 1.6; color: #333; margin-top: 5px;">{items_display}</div>'
+    html += '</div>'
+    
+    return html
+
+def format_pct(values: pd.Series) -> pd.Series:
+    """
+    Format a column of percentages for display (e.g., 45.2 -> "45.2%").
+    
+    Args:
+        values: Series of percentage values
+        
+    Returns:
+        Series of formatted strings
+    """
+    return values.map('{:.1f}%'.format)
+
 def format_rank_with_color_class(rank: str) -> str:
     """
     Format rank with color class for HTML display.
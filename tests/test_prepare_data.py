@@ -0,0 +1,58 @@
+import datetime
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_processing import USED_COLUMNS, add_calculated_columns, clean_data, prepare_data
+
+
+def _sample_feed(clocks):
+    """Minimal play feed with every column the dashboard reads"""
+    rows = len(clocks)
+    df = pd.DataFrame({col: [None] * rows for col in USED_COLUMNS})
+    df['pff_RUNPASS'] = ['R', 'P'] * (rows // 2) + ['R'] * (rows % 2)
+    df['pff_NOPLAY'] = 0
+    df['pff_CLOCK'] = clocks
+    df['pff_WEEK'] = 1
+    df['pff_QUARTER'] = 1
+    df['pff_DOWN'] = 1
+    df['pff_DISTANCE'] = 10
+    df['pff_YARDS_TO_GOAL_LINE'] = 75
+    df['pff_OFFTEAM'] = 'AAA'
+    df['pff_DEFTEAM'] = 'BBB'
+    df['pff_PASS_COVERAGE_BASIC'] = 'COVER 3'
+    df['pff_SCREEN'] = 0
+    df['pff_PLAYACTION'] = 0
+    df['pff_BLITZDOG'] = 0
+    df['pff_STUNT'] = 0
+    return df
+
+
+class PrepareDataClockTest(unittest.TestCase):
+    """minutes_remaining from MM:SS clocks read through the PyArrow CSV/Parquet path"""
+
+    def test_mm_ss_clock_csv(self):
+        # Two-digit MM:SS values only: the case PyArrow infers as a time column
+        feed = _sample_feed(['14:53', '10:05', '00:42', None])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'feed.csv')
+            feed.to_csv(path, index=False)
+            # First load writes the Parquet cache, second load reads it
+            for _ in range(2):
+                df = prepare_data(path)
+                self.assertEqual(df['minutes_remaining'].tolist(), [14, 10, 0, 0])
+
+    def test_time_typed_clock(self):
+        # Clock values already typed as datetime.time (e.g. an older Parquet cache)
+        feed = _sample_feed([datetime.time(14, 53), datetime.time(3, 7)])
+        df = add_calculated_columns(clean_data(feed))
+        self.assertEqual(df['minutes_remaining'].tolist(), [14, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()